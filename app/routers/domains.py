@@ -18,9 +18,8 @@ from app.models import Domain, User
 from app.routers.auth import require_user
 from app.services.data_version import bump_data_version
 from app.services.task_service import TaskService
+from app.utils.text import strip_control_chars
 
-# Regex to match control characters except \n (newline) and \t (tab)
-CONTROL_CHAR_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
 HEX_COLOR_PATTERN = re.compile(r"^#[0-9a-fA-F]{6}$")
 
 logger = logging.getLogger("whendoist.domains")
@@ -33,11 +32,6 @@ router = APIRouter(prefix="/domains", tags=["domains"])
 # =============================================================================
 
 
-def _strip_control_chars(value: str) -> str:
-    """Strip control characters except newline and tab."""
-    return CONTROL_CHAR_PATTERN.sub("", value)
-
-
 class DomainCreate(BaseModel):
     """Request body for creating a domain."""
 
@@ -48,7 +42,7 @@ class DomainCreate(BaseModel):
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
-        v = _strip_control_chars(v).strip()
+        v = strip_control_chars(v).strip()
         if not v:
             raise ValueError("Name cannot be empty")
         if len(v) > DOMAIN_NAME_MAX_LENGTH:
@@ -67,7 +61,7 @@ class DomainCreate(BaseModel):
     def validate_icon(cls, v: str | None) -> str | None:
         if v is None:
             return None
-        v = _strip_control_chars(v).strip()
+        v = strip_control_chars(v).strip()
         if len(v) > DOMAIN_ICON_MAX_LENGTH:
             raise ValueError(f"Icon cannot exceed {DOMAIN_ICON_MAX_LENGTH} characters")
         return v
@@ -86,7 +80,7 @@ class DomainUpdate(BaseModel):
     def validate_name(cls, v: str | None) -> str | None:
         if v is None:
             return None
-        v = _strip_control_chars(v).strip()
+        v = strip_control_chars(v).strip()
         if not v:
             raise ValueError("Name cannot be empty")
         if len(v) > DOMAIN_NAME_MAX_LENGTH:
@@ -105,7 +99,7 @@ class DomainUpdate(BaseModel):
     def validate_icon(cls, v: str | None) -> str | None:
         if v is None:
             return None
-        v = _strip_control_chars(v).strip()
+        v = strip_control_chars(v).strip()
         if len(v) > DOMAIN_ICON_MAX_LENGTH:
             raise ValueError(f"Icon cannot exceed {DOMAIN_ICON_MAX_LENGTH} characters")
         return v
@@ -223,7 +217,7 @@ class DomainContentData(BaseModel):
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
-        v = _strip_control_chars(v).strip()
+        v = strip_control_chars(v).strip()
         if not v:
             raise ValueError("Name cannot be empty")
         if len(v) > DOMAIN_NAME_MAX_LENGTH:
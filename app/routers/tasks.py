@@ -6,7 +6,6 @@ Provides REST endpoints for managing native tasks.
 
 import asyncio
 import logging
-import re
 from datetime import UTC, date, datetime, time
 from typing import Literal
 
@@ -37,9 +36,7 @@ from app.services.data_version import bump_data_version
 from app.services.preferences_service import PreferencesService
 from app.services.recurrence_service import RecurrenceService
 from app.services.task_service import TaskService
-
-# Regex to match control characters except \n (newline) and \t (tab)
-CONTROL_CHAR_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+from app.utils.text import strip_control_chars
 
 logger = logging.getLogger("whendoist.tasks")
 
@@ -51,11 +48,6 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
 # =============================================================================
 
 
-def _strip_control_chars(value: str) -> str:
-    """Strip control characters except newline and tab."""
-    return CONTROL_CHAR_PATTERN.sub("", value)
-
-
 VALID_DAYS_OF_WEEK = {"MO", "TU", "WE", "TH", "FR", "SA", "SU"}
 VALID_REMINDER_MINUTES = {0, 5, 15, 30, 60, 1440}
 
@@ -103,7 +95,7 @@ class TaskCreate(BaseModel):
     @field_validator("title")
     @classmethod
     def validate_title(cls, v: str) -> str:
-        v = _strip_control_chars(v).strip()
+        v = strip_control_chars(v).strip()
         if not v:
             raise ValueError("Title cannot be empty")
         if len(v) > TASK_TITLE_MAX_LENGTH:
@@ -115,7 +107,7 @@ class TaskCreate(BaseModel):
     def validate_description(cls, v: str | None) -> str | None:
         if v is None:
             return None
-        v = _strip_control_chars(v)
+        v = strip_control_chars(v)
         if len(v) > TASK_DESCRIPTION_MAX_LENGTH:
             raise ValueError(f"Description cannot exceed {TASK_DESCRIPTION_MAX_LENGTH} characters")
         return v
@@ -166,7 +158,7 @@ class TaskUpdate(BaseModel):
     def validate_title(cls, v: str | None) -> str | None:
         if v is None:
             return None
-        v = _strip_control_chars(v).strip()
+        v = strip_control_chars(v).strip()
         if not v:
             raise ValueError("Title cannot be empty")
         if len(v) > TASK_TITLE_MAX_LENGTH:
@@ -178,7 +170,7 @@ class TaskUpdate(BaseModel):
     def validate_description(cls, v: str | None) -> str | None:
         if v is None:
             return None
-        v = _strip_control_chars(v)
+        v = strip_control_chars(v)
         if len(v) > TASK_DESCRIPTION_MAX_LENGTH:
             raise ValueError(f"Description cannot exceed {TASK_DESCRIPTION_MAX_LENGTH} characters")
         return v
@@ -381,7 +373,7 @@ class TaskContentData(BaseModel):
     @field_validator("title")
     @classmethod
     def validate_title(cls, v: str) -> str:
-        v = _strip_control_chars(v).strip()
+        v = strip_control_chars(v).strip()
         if not v:
             raise ValueError("Title cannot be empty")
         if len(v) > TASK_TITLE_MAX_LENGTH:
@@ -393,7 +385,7 @@ class TaskContentData(BaseModel):
     def validate_description(cls, v: str | None) -> str | None:
         if v is None:
             return None
-        v = _strip_control_chars(v)
+        v = strip_control_chars(v)
         if len(v) > TASK_DESCRIPTION_MAX_LENGTH:
             raise ValueError(f"Description cannot exceed {TASK_DESCRIPTION_MAX_LENGTH} characters")
         return v
@@ -408,7 +400,7 @@ class DomainContentData(BaseModel):
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
-        v = _strip_control_chars(v).strip()
+        v = strip_control_chars(v).strip()
         if not v:
             raise ValueError("Name cannot be empty")
         if len(v) > DOMAIN_NAME_MAX_LENGTH:
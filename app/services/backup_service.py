@@ -4,7 +4,6 @@ Backup and restore service.
 Exports/imports user data as JSON for backup purposes.
 """
 
-import re
 from datetime import UTC, date, datetime, time
 from typing import Any
 
@@ -21,15 +20,7 @@ from app.constants import (
 )
 from app.models import Domain, GoogleCalendarEventSync, GoogleToken, Task, TaskInstance, UserPreferences
 from app.services.data_version import bump_data_version
-
-# Regex to match control characters except \n (newline) and \t (tab)
-CONTROL_CHAR_PATTERN = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
-
-
-def _strip_control_chars(value: str) -> str:
-    """Strip control characters except newline and tab."""
-    return CONTROL_CHAR_PATTERN.sub("", value)
-
+from app.utils.text import strip_control_chars
 
 # =============================================================================
 # Validation Schemas
@@ -80,7 +71,7 @@ class BackupTaskSchema(BaseModel):
     @field_validator("title")
     @classmethod
     def validate_title(cls, v: str) -> str:
-        v = _strip_control_chars(v).strip()
+        v = strip_control_chars(v).strip()
         if not v:
             raise ValueError("Task title cannot be empty")
         if len(v) > TASK_TITLE_MAX_LENGTH:
@@ -92,7 +83,7 @@ class BackupTaskSchema(BaseModel):
     def validate_description(cls, v: str | None) -> str | None:
         if v is None:
             return None
-        v = _strip_control_chars(v)
+        v = strip_control_chars(v)
         if len(v) > TASK_DESCRIPTION_MAX_LENGTH:
             raise ValueError(f"Task description cannot exceed {TASK_DESCRIPTION_MAX_LENGTH} characters")
         return v
@@ -138,7 +129,7 @@ class BackupDomainSchema(BaseModel):
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
-        v = _strip_control_chars(v).strip()
+        v = strip_control_chars(v).strip()
         if not v:
             raise ValueError("Domain name cannot be empty")
         if len(v) > DOMAIN_NAME_MAX_LENGTH:
@@ -108,8 +108,7 @@ class DemoService:
 
         Only operates on demo users (verified by email). No-op for real users.
         """
-        result = await self.db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+        user = await self.db.get(User, user_id)
         if not user or not self.is_demo_user(user.email):
             return
 
@@ -202,11 +201,15 @@ class DemoService:
 
     async def _seed_domains(self, task_service: TaskService) -> dict[str, Domain]:
         """Create the 5 demo domains. Returns mapping of name -> Domain."""
-        work = await task_service.create_domain(name="Work", color="#3b82f6", icon="💼")
-        health = await task_service.create_domain(name="Health & Fitness", color="#22c55e", icon="💪")
-        personal = await task_service.create_domain(name="Personal", color="#f59e0b", icon="🏠")
-        side_project = await task_service.create_domain(name="Side Project", color="#a855f7", icon="🚀")
-        learning = await task_service.create_domain(name="Learning", color="#06b6d4", icon="📚")
+        work, health, personal, side_project, learning = await task_service.create_domains_bulk(
+            [
+                ("Work", "#3b82f6", "💼"),
+                ("Health & Fitness", "#22c55e", "💪"),
+                ("Personal", "#f59e0b", "🏠"),
+                ("Side Project", "#a855f7", "🚀"),
+                ("Learning", "#06b6d4", "📚"),
+            ]
+        )
         return {
             "work": work,
             "health": health,
@@ -56,8 +56,8 @@ class PasskeyService:
 
     async def _get_user(self) -> User:
         """Get the current user."""
-        result = await self.db.execute(select(User).where(User.id == self.user_id))
-        user = result.scalar_one_or_none()
+        # Identity-map lookup: the router has usually loaded this user already
+        user = await self.db.get(User, self.user_id)
         if not user:
             raise ValueError(f"User {self.user_id} not found")
         return user
@@ -7,7 +7,7 @@ All operations are user-scoped (multi-tenant).
 
 from datetime import UTC, date, datetime, time
 
-from sqlalchemy import Select, case, func, select, update
+from sqlalchemy import Select, case, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -59,39 +59,91 @@ class TaskService:
         Idempotent: if a domain with the same name already exists for this user,
         return the existing domain (optionally updating icon/color if provided).
         """
-        # Check if domain with same name already exists
-        result = await self.db.execute(select(Domain).where(Domain.user_id == self.user_id, Domain.name == name))
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            # Update icon/color if provided and different
-            if icon and existing.icon != icon:
-                existing.icon = icon
-            if color and existing.color != color:
-                existing.color = color
-            await self.db.flush()
-            await bump_data_version(self.db, self.user_id)
-            # Note: not logging domain_created for idempotent return of existing domain
-            return existing
+        (domain,) = await self.create_domains_bulk([(name, color, icon)])
+        return domain
+
+    async def create_domains_bulk(
+        self,
+        items: list[tuple[str, str | None, str | None]],
+    ) -> list[Domain]:
+        """
+        Create several domains at once, idempotently by name.
+
+        Existing domains are looked up in one query and returned (updating icon/color
+        if provided and different); new ones are inserted in one statement with their
+        positions computed in SQL.
 
-        # Get max position for ordering
+        Args:
+            items: (name, color, icon) tuples, in the order the domains should be positioned
+
+        Returns:
+            The created or existing domains, in the same order as items
+        """
+        names = {name for name, _, _ in items}
         result = await self.db.execute(
-            select(Domain.position).where(Domain.user_id == self.user_id).order_by(Domain.position.desc()).limit(1)
+            select(Domain).where(Domain.user_id == self.user_id, Domain.name.in_(names)).order_by(Domain.id)
         )
-        max_pos = result.scalar_one_or_none() or 0
+        by_name: dict[str, Domain] = {}
+        for existing in result.scalars():
+            # Older data may hold same-named domains; the oldest one wins
+            by_name.setdefault(existing.name, existing)
+
+        changed = False
+        new_domains: dict[str, tuple[str | None, str | None]] = {}
+        for name, color, icon in items:
+            existing = by_name.get(name)
+            if existing:
+                # Update icon/color if provided and different
+                if icon and existing.icon != icon:
+                    existing.icon = icon
+                    changed = True
+                if color and existing.color != color:
+                    existing.color = color
+                    changed = True
+            elif name in new_domains:
+                # Repeated new name in one batch behaves like a second create_domain call
+                prev_color, prev_icon = new_domains[name]
+                new_domains[name] = (color or prev_color, icon or prev_icon)
+            else:
+                new_domains[name] = (color, icon)
 
-        domain = Domain(
-            user_id=self.user_id,
-            name=name,
-            color=color,
-            icon=icon,
-            position=max_pos + 1,
-        )
-        self.db.add(domain)
-        await self.db.flush()
-        await log_activity(self.db, user_id=self.user_id, event_type="domain_created", domain_id=domain.id)
-        await bump_data_version(self.db, self.user_id)
-        return domain
+        # A repeated create with identical attributes is a pure read: skip
+        # the flush and version bump so wizard re-runs don't write anything.
+        if changed:
+            await self.db.flush()
+
+        if new_domains:
+            # Append after the user's last domain; positions are computed inside the
+            # INSERT so the new rows come back in a single round trip.
+            max_position = (
+                select(func.coalesce(func.max(Domain.position), 0))
+                .where(Domain.user_id == self.user_id)
+                .scalar_subquery()
+            )
+            result = await self.db.execute(
+                insert(Domain)
+                .values(
+                    [
+                        {
+                            "user_id": self.user_id,
+                            "name": name,
+                            "color": color,
+                            "icon": icon,
+                            "position": max_position + offset,
+                        }
+                        for offset, (name, (color, icon)) in enumerate(new_domains.items(), start=1)
+                    ]
+                )
+                .returning(Domain)
+            )
+            for domain in result.scalars():
+                by_name[domain.name] = domain
+                await log_activity(self.db, user_id=self.user_id, event_type="domain_created", domain_id=domain.id)
+
+        # Note: not logging domain_created for idempotent return of existing domains
+        if changed or new_domains:
+            await bump_data_version(self.db, self.user_id)
+        return [by_name[name] for name, _, _ in items]
 
     async def update_domain(
         self,
@@ -2,6 +2,7 @@
 Utility modules for Whendoist.
 """
 
+from app.utils.text import strip_control_chars
 from app.utils.timing import log_timing
 
-__all__ = ["log_timing"]
+__all__ = ["log_timing", "strip_control_chars"]
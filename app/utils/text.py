@@ -0,0 +1,18 @@
+"""
+Text sanitization utilities.
+
+Shared by request models and backup validation to clean user-supplied
+strings before they are stored.
+"""
+
+# str.translate table deleting control characters except \t, \n and \r
+CONTROL_CHAR_TABLE = dict.fromkeys([*range(0x00, 0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F])
+
+
+def strip_control_chars(value: str) -> str:
+    """Strip control characters except tab, newline and carriage return."""
+    # Fast path: printable text has no control characters at all, and
+    # isprintable() is far cheaper than translate() on non-ASCII input
+    if value.isprintable():
+        return value
+    return value.translate(CONTROL_CHAR_TABLE)
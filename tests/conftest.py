@@ -6,34 +6,65 @@ Test Categories:
 - @pytest.mark.integration: PostgreSQL container tests (production parity)
 """
 
+import asyncio
+
 import pytest
 from sqlalchemy import event
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool, StaticPool
 
 from app.database import Base
 
 
-@pytest.fixture
-async def db_session():
-    """Create an in-memory SQLite database for fast unit testing."""
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+@pytest.fixture(scope="session")
+def sqlite_engine():
+    """
+    One in-memory SQLite engine with the schema created once per test session.
+
+    StaticPool keeps the single connection (and therefore the database) alive
+    across tests; db_session isolates tests by rolling back an outer transaction.
+    """
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False, poolclass=StaticPool)
 
-    # Enable FK enforcement so ON DELETE CASCADE works in SQLite
     @event.listens_for(engine.sync_engine, "connect")
     def _set_sqlite_pragma(dbapi_conn, _connection_record):
+        # Enable FK enforcement so ON DELETE CASCADE works in SQLite
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs nest inside it
+        dbapi_conn.isolation_level = None
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    @event.listens_for(engine.sync_engine, "begin")
+    def _do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
-    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async def _create_schema():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
 
-    async with async_session() as session:
-        yield session
+    # Sync fixture so it is independent of the per-test event loops;
+    # aiosqlite's worker thread is not tied to any single loop.
+    asyncio.run(_create_schema())
+    yield engine
+    asyncio.run(engine.dispose())
 
-    await engine.dispose()
+
+@pytest.fixture
+async def db_session(sqlite_engine):
+    """
+    Session on the shared in-memory SQLite database, rolled back after each test.
+
+    Commits inside the test only release a SAVEPOINT, so nothing outlives the test.
+    """
+    async with sqlite_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint")
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
 
 
 @pytest.fixture(scope="session")
@@ -58,13 +89,13 @@ def postgres_container():
         pytest.skip(f"PostgreSQL container unavailable: {e}")
 
 
-@pytest.fixture
-async def pg_session(postgres_container):
+@pytest.fixture(scope="session")
+def pg_engine(postgres_container):
     """
-    Create async session with real PostgreSQL for integration testing.
+    PostgreSQL engine with the schema created once per test session.
 
-    Use this fixture for tests that need PostgreSQL-specific features
-    or to verify production database compatibility.
+    NullPool: asyncpg connections are bound to the event loop that opened them,
+    and each test runs on its own loop, so connections must not be pooled.
     """
     # Convert sync URL to async
     # testcontainers returns postgresql+psycopg2:// or postgresql://
@@ -73,24 +104,38 @@ async def pg_session(postgres_container):
         "postgresql://", "postgresql+asyncpg://"
     )
 
-    engine = create_async_engine(
-        async_url,
-        echo=False,
-        pool_pre_ping=True,
-    )
+    engine = create_async_engine(async_url, echo=False, poolclass=NullPool)
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    async def _create_schema():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
 
-    # expire_on_commit=False is required for async SQLAlchemy to avoid
-    # lazy loading errors (MissingGreenlet). Use explicit refresh when needed.
-    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async def _drop_schema():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
 
-    async with async_session() as session:
-        yield session
+    asyncio.run(_create_schema())
+    yield engine
+    asyncio.run(_drop_schema())
 
-    # Clean up tables after each test
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
 
-    await engine.dispose()
+@pytest.fixture
+async def pg_session(pg_engine):
+    """
+    Create async session with real PostgreSQL for integration testing.
+
+    Use this fixture for tests that need PostgreSQL-specific features
+    or to verify production database compatibility. Each test runs inside a
+    transaction that is rolled back afterwards; commit() only releases a SAVEPOINT.
+    """
+    async with pg_engine.connect() as conn:
+        transaction = await conn.begin()
+        # expire_on_commit=False is required for async SQLAlchemy to avoid
+        # lazy loading errors (MissingGreenlet). Use explicit refresh when needed.
+        session = AsyncSession(bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint")
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
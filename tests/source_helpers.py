@@ -0,0 +1,16 @@
+"""
+Shared helpers for static source contract tests.
+
+Contract tests assert on the text of application modules rather than
+running them. Several tests inspect the same file, so reads are cached
+for the whole test session.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache
+def read_source(path: Path) -> str:
+    """Read a source file once per test session."""
+    return path.read_text()
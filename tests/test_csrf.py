@@ -13,13 +13,22 @@ v0.24.0: Security Hardening
 
 from pathlib import Path
 
+import pytest
 
+from tests.source_helpers import read_source
+
+_APP_DIR = Path(__file__).parent.parent / "app"
+_CSRF_MIDDLEWARE_FILE = _APP_DIR / "middleware" / "csrf.py"
+_MAIN_FILE = _APP_DIR / "main.py"
+
+
+@pytest.mark.contract
 class TestCSRFMiddlewareExists:
     """Contract tests for CSRF middleware existence."""
 
     def test_csrf_middleware_file_exists(self):
         """csrf.py should exist in middleware folder."""
-        assert Path("app/middleware/csrf.py").exists()
+        assert _CSRF_MIDDLEWARE_FILE.exists()
 
     def test_csrf_middleware_class_exists(self):
         """CSRFMiddleware class should exist."""
@@ -51,10 +60,11 @@ class TestCSRFMiddlewareExists:
 class TestCSRFTokenGeneration:
     """Tests for CSRF token generation."""
 
+    @pytest.mark.contract
     def test_generate_token_uses_secrets_module(self):
         """Token generation should use cryptographically secure secrets."""
-        content = Path("app/middleware/csrf.py").read_text()
-        assert "secrets.token_urlsafe" in content
+        csrf_source = read_source(_CSRF_MIDDLEWARE_FILE)
+        assert "secrets.token_urlsafe" in csrf_source
 
     def test_generate_token_has_sufficient_length(self):
         """Generated token should be at least 32 bytes (256 bits)."""
@@ -72,29 +82,18 @@ class TestCSRFTokenGeneration:
         assert len(tokens) == 100
 
 
+@pytest.mark.contract
 class TestCSRFProtectedMethods:
     """Tests for which HTTP methods require CSRF validation."""
 
-    def test_post_method_is_protected(self):
-        """POST requests should require CSRF token."""
-        content = Path("app/middleware/csrf.py").read_text()
-        assert "POST" in content
-        assert "CSRF_PROTECTED_METHODS" in content
-
-    def test_put_method_is_protected(self):
-        """PUT requests should require CSRF token."""
-        content = Path("app/middleware/csrf.py").read_text()
-        assert "PUT" in content
-
-    def test_delete_method_is_protected(self):
-        """DELETE requests should require CSRF token."""
-        content = Path("app/middleware/csrf.py").read_text()
-        assert "DELETE" in content
+    @pytest.mark.parametrize("method", ["POST", "PUT", "DELETE", "PATCH"])
+    def test_mutating_method_is_protected(self, method: str):
+        """State-changing requests should require CSRF token."""
+        from app.middleware.csrf import CSRF_PROTECTED_METHODS
 
-    def test_patch_method_is_protected(self):
-        """PATCH requests should require CSRF token."""
-        content = Path("app/middleware/csrf.py").read_text()
-        assert "PATCH" in content
+        csrf_source = read_source(_CSRF_MIDDLEWARE_FILE)
+        assert "CSRF_PROTECTED_METHODS" in csrf_source
+        assert method in CSRF_PROTECTED_METHODS
 
     def test_get_method_not_protected(self):
         """GET requests should NOT require CSRF token (safe method)."""
@@ -103,6 +102,7 @@ class TestCSRFProtectedMethods:
         assert "GET" not in CSRF_PROTECTED_METHODS
 
 
+@pytest.mark.contract
 class TestCSRFExemptPaths:
     """Tests for paths exempt from CSRF validation."""
 
@@ -121,27 +121,29 @@ class TestCSRFExemptPaths:
         assert "/ready" in CSRF_EXEMPT_PATHS
 
 
+@pytest.mark.contract
 class TestCSRFTokenValidation:
     """Tests for CSRF token validation logic."""
 
     def test_uses_constant_time_comparison(self):
         """Token comparison should use constant-time algorithm."""
-        content = Path("app/middleware/csrf.py").read_text()
-        assert "secrets.compare_digest" in content
+        csrf_source = read_source(_CSRF_MIDDLEWARE_FILE)
+        assert "secrets.compare_digest" in csrf_source
 
     def test_returns_403_on_missing_token(self):
         """Missing CSRF token should return 403."""
-        content = Path("app/middleware/csrf.py").read_text()
-        assert "403" in content
-        assert "CSRF" in content
+        csrf_source = read_source(_CSRF_MIDDLEWARE_FILE)
+        assert "403" in csrf_source
+        assert "CSRF" in csrf_source
 
     def test_returns_403_on_invalid_token(self):
         """Invalid CSRF token should return 403."""
-        content = Path("app/middleware/csrf.py").read_text()
-        assert "HTTPException" in content
-        assert "status_code=403" in content
+        csrf_source = read_source(_CSRF_MIDDLEWARE_FILE)
+        assert "HTTPException" in csrf_source
+        assert "status_code=403" in csrf_source
 
 
+@pytest.mark.contract
 class TestCSRFHeaderConfiguration:
     """Tests for CSRF header configuration."""
 
@@ -158,20 +160,22 @@ class TestCSRFHeaderConfiguration:
         assert CSRF_SESSION_KEY == "_csrf_token"
 
 
+@pytest.mark.contract
 class TestMainAppIntegration:
     """Tests verifying CSRF middleware is integrated into main app."""
 
     def test_csrf_middleware_imported(self):
         """CSRFMiddleware should be imported in main.py."""
-        content = Path("app/main.py").read_text()
-        assert "CSRFMiddleware" in content
+        main_source = read_source(_MAIN_FILE)
+        assert "CSRFMiddleware" in main_source
 
     def test_csrf_middleware_added_to_app(self):
         """CSRFMiddleware should be added to app."""
-        content = Path("app/main.py").read_text()
-        assert "app.add_middleware(CSRFMiddleware)" in content
+        main_source = read_source(_MAIN_FILE)
+        assert "app.add_middleware(CSRFMiddleware)" in main_source
 
 
+@pytest.mark.contract
 class TestCSRFDependencyAvailable:
     """Tests for CSRF dependency injection."""
 
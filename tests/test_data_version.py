@@ -143,6 +143,23 @@ async def test_bump_on_domain_create(db_session, test_user):
     assert await _get_version(db_session, test_user.id) == 1
 
 
+async def test_no_bump_on_unchanged_domain_recreate(db_session, test_user):
+    """Re-creating an existing domain with identical attributes does NOT bump."""
+    service = TaskService(db_session, test_user.id)
+
+    await service.create_domain(name="New Domain", icon="💼")
+    await db_session.flush()
+    v_after_create = await _get_version(db_session, test_user.id)
+
+    await service.create_domain(name="New Domain", icon="💼")
+    await db_session.flush()
+    assert await _get_version(db_session, test_user.id) == v_after_create
+
+    await service.create_domain(name="New Domain", icon="📁")
+    await db_session.flush()
+    assert await _get_version(db_session, test_user.id) == v_after_create + 1
+
+
 # =============================================================================
 # RecurrenceService — user-initiated vs auto-materialization
 # =============================================================================
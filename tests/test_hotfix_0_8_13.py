@@ -17,11 +17,21 @@ from datetime import date
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pytest
+
+from tests.source_helpers import read_source
+
+_APP_DIR = Path(__file__).parent.parent / "app"
+_TASKS_ROUTER_FILE = _APP_DIR / "routers" / "tasks.py"
+_CONFIG_FILE = _APP_DIR / "config.py"
+
+
 # =============================================================================
 # Recurring Task Completion Contract Tests
 # =============================================================================
 
 
+@pytest.mark.contract
 class TestRecurringTaskCompletionContract:
     """
     Verify TaskResponse includes today_instance_completed for recurring tasks.
@@ -38,8 +48,7 @@ class TestRecurringTaskCompletionContract:
         """
         TaskResponse MUST have today_instance_completed field.
         """
-        tasks_file = Path(__file__).parent.parent / "app" / "routers" / "tasks.py"
-        source = tasks_file.read_text()
+        source = read_source(_TASKS_ROUTER_FILE)
 
         assert "today_instance_completed" in source, (
             "TaskResponse must have today_instance_completed field. "
@@ -50,8 +59,7 @@ class TestRecurringTaskCompletionContract:
         """
         _task_to_response MUST check task.instances for today's date.
         """
-        tasks_file = Path(__file__).parent.parent / "app" / "routers" / "tasks.py"
-        source = tasks_file.read_text()
+        source = read_source(_TASKS_ROUTER_FILE)
 
         # Find the _task_to_response function
         assert "def _task_to_response" in source
@@ -75,8 +83,7 @@ class TestRecurringTaskCompletionContract:
         """
         today_instance_completed should be bool | None type.
         """
-        tasks_file = Path(__file__).parent.parent / "app" / "routers" / "tasks.py"
-        source = tasks_file.read_text()
+        source = read_source(_TASKS_ROUTER_FILE)
 
         # Should have proper type annotation
         assert "today_instance_completed: bool | None" in source, (
@@ -89,6 +96,7 @@ class TestRecurringTaskCompletionContract:
 # =============================================================================
 
 
+@pytest.mark.contract
 class TestPasskeyRPIDDerivation:
     """
     Verify passkey_rp_id is derived from base_url when not explicitly set.
@@ -104,8 +112,7 @@ class TestPasskeyRPIDDerivation:
         """
         Config MUST have model_validator to derive passkey_rp_id.
         """
-        config_file = Path(__file__).parent.parent / "app" / "config.py"
-        source = config_file.read_text()
+        source = read_source(_CONFIG_FILE)
 
         assert "model_validator" in source, "config.py must use model_validator to derive passkey_rp_id"
 
@@ -117,8 +124,7 @@ class TestPasskeyRPIDDerivation:
         """
         Config MUST use urlparse to extract hostname from base_url.
         """
-        config_file = Path(__file__).parent.parent / "app" / "config.py"
-        source = config_file.read_text()
+        source = read_source(_CONFIG_FILE)
 
         assert "urlparse" in source, "Config must import urlparse to extract hostname from URL"
 
@@ -128,8 +134,7 @@ class TestPasskeyRPIDDerivation:
         """
         Default passkey_rp_id should be empty string to trigger derivation.
         """
-        config_file = Path(__file__).parent.parent / "app" / "config.py"
-        source = config_file.read_text()
+        source = read_source(_CONFIG_FILE)
 
         # Should have empty default (not "localhost")
         assert 'passkey_rp_id: str = ""' in source or "passkey_rp_id: str = ''" in source, (
@@ -23,12 +23,17 @@ from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Domain, Task
+from tests.source_helpers import read_source
+
+_APP_DIR = Path(__file__).parent.parent / "app"
+_AUTH_ROUTER_FILE = _APP_DIR / "routers" / "auth.py"
 
 # =============================================================================
 # Model Column Type Tests
 # =============================================================================
 
 
+@pytest.mark.contract
 class TestEncryptedColumnTypes:
     """
     Verify that columns storing encrypted data use TEXT (unlimited length).
@@ -89,6 +94,7 @@ class TestEncryptedColumnTypes:
 # =============================================================================
 
 
+@pytest.mark.contract
 class TestTodoistOAuthRedirect:
     """
     Verify Todoist OAuth callback redirects to /settings page.
@@ -105,14 +111,13 @@ class TestTodoistOAuthRedirect:
 
         Contract test: Verify the redirect logic in auth.py source code.
         """
-        auth_file = Path(__file__).parent.parent / "app" / "routers" / "auth.py"
-        source = auth_file.read_text()
+        source = read_source(_AUTH_ROUTER_FILE)
 
         # Find the todoist_callback function
         assert "async def todoist_callback" in source, "todoist_callback function must exist"
 
         # The redirect logic should check for wizard cookie
-        callback_section = source.split("async def todoist_callback")[1]
+        _, _, callback_section = source.partition("async def todoist_callback")
 
         # Check that we have conditional redirect logic
         assert "oauth_return_to_wizard" in callback_section, (
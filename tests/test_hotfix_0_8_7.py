@@ -15,6 +15,18 @@ See tests/README.md for full test architecture.
 
 from pathlib import Path
 
+import pytest
+
+from tests.source_helpers import read_source
+
+_APP_DIR = Path(__file__).parent.parent / "app"
+_TASKS_ROUTER_FILE = _APP_DIR / "routers" / "tasks.py"
+_DOMAINS_ROUTER_FILE = _APP_DIR / "routers" / "domains.py"
+_LOGGING_CONFIG_FILE = _APP_DIR / "logging_config.py"
+
+pytestmark = pytest.mark.contract
+
+
 # =============================================================================
 # Batch Update Resilience Tests
 # =============================================================================
@@ -32,14 +44,13 @@ class TestBatchUpdateResilience:
         """
         Tasks batch update MUST commit every N items.
         """
-        tasks_file = Path(__file__).parent.parent / "app" / "routers" / "tasks.py"
-        source = tasks_file.read_text()
+        source = read_source(_TASKS_ROUTER_FILE)
 
         # Find batch_update_tasks function
         assert "async def batch_update_tasks" in source
 
-        batch_section = source.split("async def batch_update_tasks")[1]
-        batch_section = batch_section.split("\n@router")[0]
+        _, _, batch_section = source.partition("async def batch_update_tasks")
+        batch_section, _, _ = batch_section.partition("\n@router")
 
         # Should have batch_size and periodic commits
         assert "batch_size" in batch_section, "Tasks batch update should define batch_size"
@@ -49,11 +60,10 @@ class TestBatchUpdateResilience:
         """
         Tasks batch update MUST handle individual item failures.
         """
-        tasks_file = Path(__file__).parent.parent / "app" / "routers" / "tasks.py"
-        source = tasks_file.read_text()
+        source = read_source(_TASKS_ROUTER_FILE)
 
-        batch_section = source.split("async def batch_update_tasks")[1]
-        batch_section = batch_section.split("\n@router")[0]
+        _, _, batch_section = source.partition("async def batch_update_tasks")
+        batch_section, _, _ = batch_section.partition("\n@router")
 
         # Should have try/except for individual items
         assert "errors = []" in batch_section or "errors.append" in batch_section, (
@@ -66,11 +76,10 @@ class TestBatchUpdateResilience:
 
         Domains are fewer than tasks, so we commit each one individually.
         """
-        domains_file = Path(__file__).parent.parent / "app" / "routers" / "domains.py"
-        source = domains_file.read_text()
+        source = read_source(_DOMAINS_ROUTER_FILE)
 
-        batch_section = source.split("async def batch_update_domains")[1]
-        batch_section = batch_section.split("\n@router")[0] if "\n@router" in batch_section else batch_section
+        _, _, batch_section = source.partition("async def batch_update_domains")
+        batch_section, _, _ = batch_section.partition("\n@router")
 
         # Should commit within the loop
         assert "await db.commit()" in batch_section, "Domains batch update should commit per item"
@@ -102,8 +111,7 @@ class TestLoggingFormat:
         """
         Exception formatter MUST limit number of frames shown.
         """
-        logging_file = Path(__file__).parent.parent / "app" / "logging_config.py"
-        source = logging_file.read_text()
+        source = read_source(_LOGGING_CONFIG_FILE)
 
         assert "MAX_FRAMES" in source, "Exception formatter should have MAX_FRAMES limit"
 
@@ -111,8 +119,7 @@ class TestLoggingFormat:
         """
         Exception formatter MUST filter to show only app code frames.
         """
-        logging_file = Path(__file__).parent.parent / "app" / "logging_config.py"
-        source = logging_file.read_text()
+        source = read_source(_LOGGING_CONFIG_FILE)
 
         assert '"/app/"' in source, "Exception formatter should filter for /app/ paths"
         assert '"/site-packages/"' in source, "Exception formatter should exclude /site-packages/ paths"
@@ -121,8 +128,7 @@ class TestLoggingFormat:
         """
         Exception formatter MUST have special handling for connection errors.
         """
-        logging_file = Path(__file__).parent.parent / "app" / "logging_config.py"
-        source = logging_file.read_text()
+        source = read_source(_LOGGING_CONFIG_FILE)
 
         assert "ConnectionDoesNotExistError" in source or "connection was closed" in source, (
             "Exception formatter should detect connection errors"
@@ -13,6 +13,8 @@ Related Issues: Settings > Google Calendars toggle doesn't work
 v0.28.1: Calendar Toggle Fix
 """
 
+import pytest
+
 
 class TestCalendarToggleUrlEncoding:
     """
@@ -28,25 +30,23 @@ class TestCalendarToggleUrlEncoding:
     not individual toggle endpoints with IDs in the URL path.
     """
 
-    def test_calendar_toggle_endpoint_registered(self):
-        """Verify the calendar toggle endpoint exists."""
+    @pytest.mark.parametrize(
+        "route",
+        [
+            # Individual toggle endpoint (calendar ID in the URL path)
+            "/api/v1/calendars/{calendar_id}/toggle",
+            # Bulk selections endpoint (used by wizard)
+            "/api/v1/calendars/selections",
+        ],
+        ids=["toggle", "selections"],
+    )
+    def test_calendar_endpoint_registered(self, route: str):
+        """Verify the calendar toggle and selections endpoints exist."""
         from app.main import app
 
         routes = [r.path for r in app.routes if hasattr(r, "path")]
 
-        # The toggle endpoint should be registered
-        toggle_route = "/api/v1/calendars/{calendar_id}/toggle"
-        assert toggle_route in routes, (
-            f"Calendar toggle endpoint {toggle_route} must be registered. "
+        assert route in routes, (
+            f"Calendar endpoint {route} must be registered. "
             f"Available calendar routes: {[r for r in routes if 'calendar' in r.lower()]}"
         )
-
-    def test_calendar_selections_endpoint_registered(self):
-        """Verify the bulk calendar selections endpoint exists (used by wizard)."""
-        from app.main import app
-
-        routes = [r.path for r in app.routes if hasattr(r, "path")]
-
-        # The selections endpoint should be registered
-        selections_route = "/api/v1/calendars/selections"
-        assert selections_route in routes, f"Calendar selections endpoint {selections_route} must be registered"
@@ -17,18 +17,43 @@ was removed from the wizard to reduce onboarding friction. Encryption setup
 is still available in Settings.
 """
 
+import ast
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import User
+from app.models import Domain, User
+from app.services.task_service import TaskService
+from tests.source_helpers import read_source
+
+_APP_DIR = Path(__file__).parent.parent / "app"
+_AUTH_ROUTER_FILE = _APP_DIR / "routers" / "auth.py"
+_TASK_SERVICE_FILE = _APP_DIR / "services" / "task_service.py"
+
+
+@lru_cache
+def _tree(path: Path) -> ast.Module:
+    """Parse a source file once per test session."""
+    return ast.parse(read_source(path))
+
+
+@lru_cache
+def _section(path: Path, func_name: str) -> str:
+    """Source of ``async def func_name``, located via the AST and extracted once per session."""
+    for node in ast.walk(_tree(path)):
+        if isinstance(node, ast.AsyncFunctionDef) and node.name == func_name:
+            return ast.get_source_segment(read_source(path), node) or ""
+    return ""
+
 
 # =============================================================================
 # Google User Name Update Tests
 # =============================================================================
 
 
+@pytest.mark.contract
 class TestGoogleUserNameUpdate:
     """
     Verify Google OAuth callback always updates user name.
@@ -39,11 +64,8 @@ class TestGoogleUserNameUpdate:
 
     def test_callback_always_updates_name(self):
         """Google OAuth callback must always update name when available."""
-        auth_file = Path(__file__).parent.parent / "app" / "routers" / "auth.py"
-        source = auth_file.read_text()
-
         # Find google_callback function
-        callback_section = source.split("async def google_callback")[1].split("async def")[0]
+        callback_section = _section(_AUTH_ROUTER_FILE, "google_callback")
 
         # Must update name unconditionally (not "and not user.name")
         assert "elif name:" in callback_section
@@ -56,6 +78,7 @@ class TestGoogleUserNameUpdate:
 # =============================================================================
 
 
+@pytest.mark.contract
 class TestIdempotentDomainCreation:
     """
     Verify domain creation is idempotent (doesn't create duplicates).
@@ -66,146 +89,103 @@ class TestIdempotentDomainCreation:
 
     def test_create_domain_checks_existing(self):
         """create_domain must check if domain already exists."""
-        service_file = Path(__file__).parent.parent / "app" / "services" / "task_service.py"
-        source = service_file.read_text()
-
-        # Find create_domain function
-        create_section = source.split("async def create_domain")[1].split("async def")[0]
+        # create_domain delegates to the bulk path, which holds the dedup rules
+        create_section = _section(_TASK_SERVICE_FILE, "create_domain")
+        assert "self.create_domains_bulk(" in create_section
 
-        # Must check for existing domain with same name
-        assert "Domain.name == name" in create_section or "name == name" in create_section
+        # Must check for existing domains with the same names
+        bulk_section = _section(_TASK_SERVICE_FILE, "create_domains_bulk")
+        assert "Domain.name.in_(names)" in bulk_section
 
     def test_create_domain_returns_existing_if_found(self):
         """create_domain must return existing domain if found."""
-        service_file = Path(__file__).parent.parent / "app" / "services" / "task_service.py"
-        source = service_file.read_text()
+        bulk_section = _section(_TASK_SERVICE_FILE, "create_domains_bulk")
 
-        create_section = source.split("async def create_domain")[1].split("async def")[0]
+        # Must look up existing domains by name instead of always inserting
+        assert "by_name" in bulk_section
 
-        # Must have logic to return existing
-        assert "if existing:" in create_section or "existing = result.scalar_one_or_none()" in create_section
-        assert "return existing" in create_section
+
+@pytest.fixture
+async def task_service(db_session: AsyncSession) -> TaskService:
+    """Create task service instance for a fresh test user."""
+    user = User(email="test@example.com")
+    db_session.add(user)
+    await db_session.flush()
+    return TaskService(db_session, user.id)
 
 
 @pytest.mark.asyncio
 class TestIdempotentDomainCreationIntegration:
     """Integration tests for idempotent domain creation."""
 
-    async def test_create_domain_twice_returns_same(self, db_session: AsyncSession):
-        """Creating a domain with same name twice returns the same domain."""
-        from app.services.task_service import TaskService
-
-        user = User(email="test@example.com")
-        db_session.add(user)
-        await db_session.flush()
-
-        service = TaskService(db_session, user.id)
-
-        # Create domain first time
-        domain1 = await service.create_domain(name="Work", icon="💼")
-        await db_session.flush()
-
-        # Create domain with same name again
-        domain2 = await service.create_domain(name="Work", icon="💼")
-        await db_session.flush()
-
-        # Should return same domain
-        assert domain1.id == domain2.id
-
-    async def test_create_domain_updates_icon_on_duplicate(self, db_session: AsyncSession):
-        """Creating existing domain with new icon updates the icon."""
-        from app.services.task_service import TaskService
-
-        user = User(email="test@example.com")
-        db_session.add(user)
-        await db_session.flush()
-
-        service = TaskService(db_session, user.id)
-
+    @pytest.mark.parametrize(
+        ("name", "first_icon", "second_icon"),
+        [
+            ("Work", "💼", "💼"),
+            ("Work", "📁", "💼"),
+            ("Side Project", "🚀", "🚀"),
+        ],
+        ids=["same_icon", "updated_icon", "custom_emoji"],
+    )
+    async def test_create_domain_twice_returns_same(
+        self, task_service: TaskService, name: str, first_icon: str, second_icon: str
+    ):
+        """Creating a domain with same name twice returns the same domain, updating the icon."""
         # Create domain first time
-        domain1 = await service.create_domain(name="Work", icon="📁")
-        await db_session.flush()
+        domain1 = await task_service.create_domain(name=name, icon=first_icon)
 
-        # Create domain with same name but different icon
-        domain2 = await service.create_domain(name="Work", icon="💼")
-        await db_session.flush()
+        # Create domain with same name again (possibly with a different icon)
+        domain2 = await task_service.create_domain(name=name, icon=second_icon)
 
-        # Should return same domain with updated icon
+        # Should return same domain with the latest icon
         assert domain1.id == domain2.id
-        assert domain2.icon == "💼"
+        assert domain2.icon == second_icon
 
-    async def test_create_domain_preserves_tasks_on_duplicate(self, db_session: AsyncSession):
+    async def test_create_domain_preserves_tasks_on_duplicate(self, task_service: TaskService):
         """Creating duplicate domain does not affect existing tasks."""
-        from app.services.task_service import TaskService
-
-        user = User(email="test@example.com")
-        db_session.add(user)
-        await db_session.flush()
-
-        service = TaskService(db_session, user.id)
-
         # Create domain and add tasks
-        domain1 = await service.create_domain(name="Work", icon="💼")
-        await db_session.flush()
+        domain1 = await task_service.create_domain(name="Work", icon="💼")
 
-        task1 = await service.create_task(title="Task 1", domain_id=domain1.id)
-        task2 = await service.create_task(title="Task 2", domain_id=domain1.id)
-        await db_session.flush()
+        task1 = await task_service.create_task(title="Task 1", domain_id=domain1.id)
+        task2 = await task_service.create_task(title="Task 2", domain_id=domain1.id)
 
         # Verify tasks exist
-        tasks_before = await service.get_tasks(status=None, top_level_only=True)
-        domain_tasks_before = [t for t in tasks_before if t.domain_id == domain1.id]
+        domain_tasks_before = await task_service.get_tasks(status=None, top_level_only=True, domain_id=domain1.id)
         assert len(domain_tasks_before) == 2
 
         # Create domain with same name again
-        domain2 = await service.create_domain(name="Work", icon="💼")
-        await db_session.flush()
+        domain2 = await task_service.create_domain(name="Work", icon="💼")
 
         # Verify it's the same domain
         assert domain1.id == domain2.id
 
         # Verify tasks are still there
-        tasks_after = await service.get_tasks(status=None, top_level_only=True)
-        domain_tasks_after = [t for t in tasks_after if t.domain_id == domain1.id]
+        domain_tasks_after = await task_service.get_tasks(status=None, top_level_only=True, domain_id=domain1.id)
         assert len(domain_tasks_after) == 2
         assert task1.id in [t.id for t in domain_tasks_after]
         assert task2.id in [t.id for t in domain_tasks_after]
 
-    async def test_custom_domain_with_emoji_dedup(self, db_session: AsyncSession):
+    async def test_custom_domain_with_emoji_dedup(self, task_service: TaskService):
         """Custom domain with custom emoji is deduplicated correctly."""
-        from app.services.task_service import TaskService
-
-        user = User(email="test@example.com")
-        db_session.add(user)
-        await db_session.flush()
-
-        service = TaskService(db_session, user.id)
-
         # Create custom domain with emoji
-        domain1 = await service.create_domain(name="Side Project", icon="🚀")
-        await db_session.flush()
+        domain1 = await task_service.create_domain(name="Side Project", icon="🚀")
 
         # Add a task to make it "in use"
-        await service.create_task(title="Build MVP", domain_id=domain1.id)
-        await db_session.flush()
+        await task_service.create_task(title="Build MVP", domain_id=domain1.id)
 
         # Try to create same domain again (like wizard re-run)
-        domain2 = await service.create_domain(name="Side Project", icon="🚀")
-        await db_session.flush()
+        domain2 = await task_service.create_domain(name="Side Project", icon="🚀")
 
         # Should return same domain
         assert domain1.id == domain2.id
 
         # Tasks should still be there
-        tasks = await service.get_tasks(status=None, top_level_only=True)
-        domain_tasks = [t for t in tasks if t.domain_id == domain1.id]
+        domain_tasks = await task_service.get_tasks(status=None, top_level_only=True, domain_id=domain1.id)
         assert len(domain_tasks) == 1
         assert domain_tasks[0].title == "Build MVP"
 
     async def test_multiple_users_can_have_same_domain_name(self, db_session: AsyncSession):
         """Different users can have domains with the same name."""
-        from app.services.task_service import TaskService
-
         # Create two users
         user1 = User(email="user1@example.com")
         user2 = User(email="user2@example.com")
@@ -218,51 +198,64 @@ class TestIdempotentDomainCreationIntegration:
         # Both users create "Work" domain
         domain1 = await service1.create_domain(name="Work", icon="💼")
         domain2 = await service2.create_domain(name="Work", icon="💼")
-        await db_session.flush()
 
         # Should be different domains (different IDs)
         assert domain1.id != domain2.id
         assert domain1.user_id == user1.id
         assert domain2.user_id == user2.id
 
-    async def test_dedup_is_case_sensitive(self, db_session: AsyncSession):
+    async def test_dedup_is_case_sensitive(self, task_service: TaskService):
         """Domain deduplication is case-sensitive."""
-        from app.services.task_service import TaskService
-
-        user = User(email="test@example.com")
-        db_session.add(user)
-        await db_session.flush()
-
-        service = TaskService(db_session, user.id)
-
         # Create "Work" domain
-        domain1 = await service.create_domain(name="Work", icon="💼")
-        await db_session.flush()
+        domain1 = await task_service.create_domain(name="Work", icon="💼")
 
         # Create "work" (lowercase) domain - should be different
-        domain2 = await service.create_domain(name="work", icon="💼")
-        await db_session.flush()
+        domain2 = await task_service.create_domain(name="work", icon="💼")
 
         # Should be different domains (case-sensitive)
         assert domain1.id != domain2.id
 
-    async def test_dedup_with_whitespace_variants(self, db_session: AsyncSession):
+    async def test_dedup_with_whitespace_variants(self, task_service: TaskService):
         """Domain names with different whitespace are treated as different."""
-        from app.services.task_service import TaskService
-
-        user = User(email="test@example.com")
-        db_session.add(user)
-        await db_session.flush()
-
-        service = TaskService(db_session, user.id)
-
         # Create "Work" domain
-        domain1 = await service.create_domain(name="Work", icon="💼")
-        await db_session.flush()
+        domain1 = await task_service.create_domain(name="Work", icon="💼")
 
         # Create " Work" (leading space) - should be different
-        domain2 = await service.create_domain(name=" Work", icon="💼")
-        await db_session.flush()
+        domain2 = await task_service.create_domain(name=" Work", icon="💼")
 
         # Should be different domains
         assert domain1.id != domain2.id
+
+    async def test_create_domains_bulk_matches_create_domain(self, task_service: TaskService):
+        """Bulk creation reuses existing domains and appends new ones in order."""
+        work = await task_service.create_domain(name="Work", icon="📁")
+
+        domains = await task_service.create_domains_bulk(
+            [("Work", None, "💼"), ("Health", "#22c55e", "💪"), ("Learning", None, "📚")]
+        )
+
+        assert [d.name for d in domains] == ["Work", "Health", "Learning"]
+        assert domains[0].id == work.id
+        assert domains[0].icon == "💼"
+        assert [d.position for d in domains[1:]] == [work.position + 1, work.position + 2]
+        assert all(d.id is not None for d in domains)
+
+    async def test_create_domains_bulk_dedups_within_batch(self, task_service: TaskService):
+        """Repeating a name inside one batch yields a single domain."""
+        domains = await task_service.create_domains_bulk([("Work", None, "💼"), ("Work", None, "💼")])
+
+        assert domains[0] is domains[1]
+        assert len(await task_service.get_domains()) == 1
+
+    async def test_existing_duplicate_names_resolve_to_oldest(
+        self, db_session: AsyncSession, task_service: TaskService
+    ):
+        """Pre-existing same-named domains (e.g. from imports) resolve to the oldest one."""
+        older = Domain(user_id=task_service.user_id, name="Work", position=1)
+        newer = Domain(user_id=task_service.user_id, name="Work", position=2)
+        db_session.add_all([older, newer])
+        await db_session.flush()
+
+        assert (await task_service.create_domain(name="Work")).id == older.id
+        (domain,) = await task_service.create_domains_bulk([("Work", None, None)])
+        assert domain.id == older.id
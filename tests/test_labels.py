@@ -1,3 +1,5 @@
+import pytest
+
 from app.services.labels import (
     Clarity,
     clarity_display,
@@ -7,27 +9,29 @@ from app.services.labels import (
 
 
 class TestParseLabels:
-    def test_parse_clarity_labels(self):
+    @pytest.mark.parametrize(
+        ("label", "expected"),
+        [
+            ("autopilot", Clarity.AUTOPILOT),
+            ("normal", Clarity.NORMAL),
+            ("brainstorm", Clarity.BRAINSTORM),
+        ],
+    )
+    def test_parse_clarity_labels(self, label: str, expected: Clarity):
         """Test mode labels (new names)."""
-        result = parse_labels(["autopilot"])
-        assert result.clarity == Clarity.AUTOPILOT
-
-        result = parse_labels(["normal"])
-        assert result.clarity == Clarity.NORMAL
-
-        result = parse_labels(["brainstorm"])
-        assert result.clarity == Clarity.BRAINSTORM
-
-    def test_parse_legacy_clarity_labels(self):
+        assert parse_labels([label]).clarity == expected
+
+    @pytest.mark.parametrize(
+        ("label", "expected"),
+        [
+            ("clear", Clarity.AUTOPILOT),
+            ("defined", Clarity.NORMAL),
+            ("open", Clarity.BRAINSTORM),
+        ],
+    )
+    def test_parse_legacy_clarity_labels(self, label: str, expected: Clarity):
         """Test legacy clarity labels map to new mode values."""
-        result = parse_labels(["clear"])
-        assert result.clarity == Clarity.AUTOPILOT
-
-        result = parse_labels(["defined"])
-        assert result.clarity == Clarity.NORMAL
-
-        result = parse_labels(["open"])
-        assert result.clarity == Clarity.BRAINSTORM
+        assert parse_labels([label]).clarity == expected
 
     def test_parse_multiple_labels(self):
         """Test parsing multiple labels at once."""
@@ -50,13 +54,10 @@ class TestParseLabels:
         assert result.clarity is None
         assert result.other_labels == ["project-x", "meeting", "followup"]
 
-    def test_case_insensitivity(self):
+    @pytest.mark.parametrize(("label", "expected"), [("Clear", Clarity.AUTOPILOT), ("DEFINED", Clarity.NORMAL)])
+    def test_case_insensitivity(self, label: str, expected: Clarity):
         """Test that label matching is case-insensitive."""
-        result = parse_labels(["Clear"])
-        assert result.clarity == Clarity.AUTOPILOT
-
-        result = parse_labels(["DEFINED"])
-        assert result.clarity == Clarity.NORMAL
+        assert parse_labels([label]).clarity == expected
 
     def test_is_unlabeled_missing_clarity(self):
         """Test is_unlabeled returns True when clarity is missing."""
@@ -90,9 +90,8 @@ async def test_passkey(db_session: AsyncSession, user_with_encryption: User) ->
 @pytest.fixture
 async def multiple_passkeys(db_session: AsyncSession, user_with_encryption: User) -> list[UserPasskey]:
     """Create multiple passkeys for testing multi-passkey scenarios."""
-    passkeys = []
-    for i in range(3):
-        passkey = UserPasskey(
+    passkeys = [
+        UserPasskey(
             user_id=user_with_encryption.id,
             credential_id=f"credential-{i}".encode(),
             public_key=f"public-key-{i}".encode(),
@@ -102,8 +101,9 @@ async def multiple_passkeys(db_session: AsyncSession, user_with_encryption: User
             prf_salt=f"salt-{i}",
             wrapped_key=f"wrapped-key-{i}",
         )
-        db_session.add(passkey)
-        passkeys.append(passkey)
+        for i in range(3)
+    ]
+    db_session.add_all(passkeys)
     await db_session.flush()
     return passkeys
 
@@ -385,19 +385,12 @@ class TestPasskeyDataModel:
         # Verify the old broken attribute doesn't exist
         assert not hasattr(test_passkey, "encryption_test_value")
 
-    async def test_passkey_has_required_webauthn_fields(
-        self, db_session: AsyncSession, user_with_encryption: User, test_passkey: UserPasskey
-    ):
-        """UserPasskey has all required WebAuthn fields."""
-        assert test_passkey.credential_id is not None
-        assert test_passkey.public_key is not None
-        assert test_passkey.sign_count is not None
-        assert test_passkey.prf_salt is not None
-
-    async def test_passkey_has_user_friendly_metadata(
-        self, db_session: AsyncSession, user_with_encryption: User, test_passkey: UserPasskey
-    ):
-        """UserPasskey stores user-friendly metadata."""
+    async def test_passkey_has_required_fields(self, test_passkey: UserPasskey):
+        """UserPasskey has all required WebAuthn fields and user-friendly metadata."""
+        # WebAuthn fields
+        for field in ("credential_id", "public_key", "sign_count", "prf_salt"):
+            assert getattr(test_passkey, field) is not None, field
+        # User-friendly metadata
         assert test_passkey.name is not None
         assert test_passkey.created_at is not None
         # last_used_at can be None initially
@@ -9,6 +9,22 @@ Verifies:
 
 from pathlib import Path
 
+import pytest
+
+from tests.source_helpers import read_source
+
+_APP_DIR = Path(__file__).parent.parent / "app"
+_AUTH_ROUTER_FILE = _APP_DIR / "routers" / "auth.py"
+_BACKUP_ROUTER_FILE = _APP_DIR / "routers" / "backup.py"
+_GCAL_SYNC_ROUTER_FILE = _APP_DIR / "routers" / "gcal_sync.py"
+_IMPORT_DATA_ROUTER_FILE = _APP_DIR / "routers" / "import_data.py"
+_PASSKEYS_ROUTER_FILE = _APP_DIR / "routers" / "passkeys.py"
+_PREFERENCES_ROUTER_FILE = _APP_DIR / "routers" / "preferences.py"
+_MAIN_FILE = _APP_DIR / "main.py"
+_PYPROJECT_FILE = _APP_DIR.parent / "pyproject.toml"
+
+pytestmark = pytest.mark.contract
+
 
 class TestRateLimitConfiguration:
     """Tests for rate limit configuration."""
@@ -57,7 +73,7 @@ class TestRateLimitedEndpoints:
 
     def test_passkey_register_options_has_rate_limit(self):
         """passkeys.py register/options should have rate limiting."""
-        passkeys_content = Path("app/routers/passkeys.py").read_text()
+        passkeys_content = read_source(_PASSKEYS_ROUTER_FILE)
 
         # Check that the endpoint has the limiter decorator
         assert "@limiter.limit(ENCRYPTION_LIMIT)" in passkeys_content
@@ -65,7 +81,7 @@ class TestRateLimitedEndpoints:
 
     def test_passkey_register_verify_has_rate_limit(self):
         """passkeys.py register/verify should have rate limiting."""
-        passkeys_content = Path("app/routers/passkeys.py").read_text()
+        passkeys_content = read_source(_PASSKEYS_ROUTER_FILE)
 
         # The decorator should appear before verify_registration
         assert "@limiter.limit(ENCRYPTION_LIMIT)" in passkeys_content
@@ -73,35 +89,35 @@ class TestRateLimitedEndpoints:
 
     def test_passkey_authenticate_options_has_rate_limit(self):
         """passkeys.py authenticate/options should have rate limiting."""
-        passkeys_content = Path("app/routers/passkeys.py").read_text()
+        passkeys_content = read_source(_PASSKEYS_ROUTER_FILE)
 
         assert "@limiter.limit(ENCRYPTION_LIMIT)" in passkeys_content
         assert "async def get_authentication_options" in passkeys_content
 
     def test_passkey_authenticate_verify_has_rate_limit(self):
         """passkeys.py authenticate/verify should have rate limiting."""
-        passkeys_content = Path("app/routers/passkeys.py").read_text()
+        passkeys_content = read_source(_PASSKEYS_ROUTER_FILE)
 
         assert "@limiter.limit(ENCRYPTION_LIMIT)" in passkeys_content
         assert "async def verify_authentication" in passkeys_content
 
     def test_encryption_setup_has_rate_limit(self):
         """preferences.py encryption/setup should have rate limiting."""
-        preferences_content = Path("app/routers/preferences.py").read_text()
+        preferences_content = read_source(_PREFERENCES_ROUTER_FILE)
 
         assert "@limiter.limit(ENCRYPTION_LIMIT)" in preferences_content
         assert "async def setup_encryption" in preferences_content
 
     def test_encryption_disable_has_rate_limit(self):
         """preferences.py encryption/disable should have rate limiting."""
-        preferences_content = Path("app/routers/preferences.py").read_text()
+        preferences_content = read_source(_PREFERENCES_ROUTER_FILE)
 
         assert "@limiter.limit(ENCRYPTION_LIMIT)" in preferences_content
         assert "async def disable_encryption" in preferences_content
 
     def test_auth_callbacks_have_rate_limit(self):
         """Auth OAuth callbacks should have rate limiting."""
-        auth_content = Path("app/routers/auth.py").read_text()
+        auth_content = read_source(_AUTH_ROUTER_FILE)
 
         assert "@limiter.limit(AUTH_LIMIT)" in auth_content
         assert "async def google_callback" in auth_content
@@ -109,21 +125,21 @@ class TestRateLimitedEndpoints:
 
     def test_backup_export_has_rate_limit(self):
         """backup.py export should have rate limiting."""
-        backup_content = Path("app/routers/backup.py").read_text()
+        backup_content = read_source(_BACKUP_ROUTER_FILE)
 
         assert "@limiter.limit(BACKUP_LIMIT" in backup_content
         assert "async def export_backup" in backup_content
 
     def test_backup_import_has_rate_limit(self):
         """backup.py import should have rate limiting."""
-        backup_content = Path("app/routers/backup.py").read_text()
+        backup_content = read_source(_BACKUP_ROUTER_FILE)
 
         assert "@limiter.limit(BACKUP_LIMIT" in backup_content
         assert "async def import_backup" in backup_content
 
     def test_backup_rate_limits_use_user_key(self):
         """Backup rate limits should use user-based key function."""
-        backup_content = Path("app/routers/backup.py").read_text()
+        backup_content = read_source(_BACKUP_ROUTER_FILE)
 
         # Verify get_user_or_ip is imported and used
         assert "get_user_or_ip" in backup_content
@@ -131,49 +147,49 @@ class TestRateLimitedEndpoints:
 
     def test_import_wipe_has_rate_limit(self):
         """import_data.py wipe should have rate limiting."""
-        import_data_content = Path("app/routers/import_data.py").read_text()
+        import_data_content = read_source(_IMPORT_DATA_ROUTER_FILE)
 
         assert "@limiter.limit(BACKUP_LIMIT" in import_data_content
         assert "async def wipe_user_data" in import_data_content
 
     def test_import_todoist_preview_has_rate_limit(self):
         """import_data.py todoist/preview should have rate limiting."""
-        import_data_content = Path("app/routers/import_data.py").read_text()
+        import_data_content = read_source(_IMPORT_DATA_ROUTER_FILE)
 
         assert "@limiter.limit(BACKUP_LIMIT" in import_data_content
         assert "async def preview_todoist_import" in import_data_content
 
     def test_import_todoist_has_rate_limit(self):
         """import_data.py todoist import should have rate limiting."""
-        import_data_content = Path("app/routers/import_data.py").read_text()
+        import_data_content = read_source(_IMPORT_DATA_ROUTER_FILE)
 
         assert "@limiter.limit(BACKUP_LIMIT" in import_data_content
         assert "async def import_from_todoist" in import_data_content
 
     def test_gcal_sync_enable_has_rate_limit(self):
         """gcal_sync.py enable should have rate limiting."""
-        gcal_sync_content = Path("app/routers/gcal_sync.py").read_text()
+        gcal_sync_content = read_source(_GCAL_SYNC_ROUTER_FILE)
 
         assert "@limiter.limit(BACKUP_LIMIT" in gcal_sync_content
         assert "async def enable_sync" in gcal_sync_content
 
     def test_gcal_sync_disable_has_rate_limit(self):
         """gcal_sync.py disable should have rate limiting."""
-        gcal_sync_content = Path("app/routers/gcal_sync.py").read_text()
+        gcal_sync_content = read_source(_GCAL_SYNC_ROUTER_FILE)
 
         assert "@limiter.limit(BACKUP_LIMIT" in gcal_sync_content
         assert "async def disable_sync" in gcal_sync_content
 
     def test_gcal_sync_full_sync_has_rate_limit(self):
         """gcal_sync.py full-sync should have rate limiting."""
-        gcal_sync_content = Path("app/routers/gcal_sync.py").read_text()
+        gcal_sync_content = read_source(_GCAL_SYNC_ROUTER_FILE)
 
         assert "@limiter.limit(BACKUP_LIMIT" in gcal_sync_content
         assert "async def full_sync" in gcal_sync_content
 
     def test_passkey_delete_has_rate_limit(self):
         """passkeys.py delete should have rate limiting."""
-        passkeys_content = Path("app/routers/passkeys.py").read_text()
+        passkeys_content = read_source(_PASSKEYS_ROUTER_FILE)
 
         assert "@limiter.limit(ENCRYPTION_LIMIT)" in passkeys_content
         assert "async def delete_passkey" in passkeys_content
@@ -184,20 +200,20 @@ class TestMainAppIntegration:
 
     def test_limiter_state_set_on_app(self):
         """main.py should set app.state.limiter."""
-        main_content = Path("app/main.py").read_text()
+        main_content = read_source(_MAIN_FILE)
 
         assert "app.state.limiter = limiter" in main_content
 
     def test_rate_limit_exception_handler_added(self):
         """main.py should add RateLimitExceeded exception handler."""
-        main_content = Path("app/main.py").read_text()
+        main_content = read_source(_MAIN_FILE)
 
         assert "RateLimitExceeded" in main_content
         assert "_rate_limit_exceeded_handler" in main_content
 
     def test_slowapi_imported(self):
         """slowapi should be imported in main.py."""
-        main_content = Path("app/main.py").read_text()
+        main_content = read_source(_MAIN_FILE)
 
         assert "from slowapi" in main_content
 
@@ -207,6 +223,6 @@ class TestSlowAPIInDependencies:
 
     def test_slowapi_in_pyproject(self):
         """slowapi should be listed in pyproject.toml dependencies."""
-        pyproject_content = Path("pyproject.toml").read_text()
+        pyproject_content = read_source(_PYPROJECT_FILE)
 
         assert "slowapi" in pyproject_content